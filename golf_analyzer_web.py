@@ -22,7 +22,7 @@ st.set_page_config(
 def load_data(file_path='golfshot_scores.json'):
     """Load golf data from JSON file"""
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except FileNotFoundError:
         return None
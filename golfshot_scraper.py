@@ -6,21 +6,200 @@ Extracts hole-by-hole scores from Golfshot.com and calculates scoring statistics
 
 import asyncio
 import csv
+import gzip
 import json
+import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from http.cookies import Morsel
+from operator import itemgetter
+from pathlib import Path
+import aiohttp
+import numpy as np
+import orjson
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from yarl import URL
 import os
 
+# uvloop is a faster event loop, but isn't available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Number of rounds fetched in parallel
+CONCURRENCY = 8
+
+# Browser profile directory; keeps the login session between runs
+PROFILE_DIR = '.gs_profile'
+
+# Set HEADLESS = False to watch the browser (e.g. to debug the login)
+HEADLESS = True
+BROWSER_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-features=TranslateUI',
+    '--renderer-process-limit=1',
+    '--js-flags=--max-old-space-size=256',
+]
+
+GOLFSHOT_URL = URL("https://play.golfshot.com/")
+ROUNDS_URL = "https://play.golfshot.com/profiles/lOJZ5/rounds"
+ROUND_ROW_SELECTOR = 'tr[data-href*="/rounds/"]'
+
+# Requests the scraper never needs; aborted to save bandwidth
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet', 'other'}
+BLOCKED_URL_PARTS = ('analytics', 'doubleclick', 'googletagmanager', 'facebook')
+
+# Raw scorecard models, one file per round; rounds never change once posted
+CACHE_DIR = Path('cache')
+
+# Start of the scorecard props in the React hydration script; matched
+# against the raw response bytes so the whole page never gets decoded
+SCORECARD_START = re.compile(rb'React\.createElement\(Golfshot\.Applications\.Scorecard,\s*', re.DOTALL)
+
+JSON_DECODER = json.JSONDecoder()
+
+get_score = itemgetter('score')
+
+# Score-type buckets, indexed by score - par + 2 (clamped); eagle or better first
+STAT_KEYS = ('eagles', 'birdies', 'pars', 'bogeys', 'double_bogeys', 'worse')
+
+
+def extract_scorecard_json(html, encoding='utf-8'):
+    """Pull the scorecard props object out of the React hydration script"""
+    match = SCORECARD_START.search(html)
+    if not match:
+        return None
+    
+    # Find where the JSON starts (after the opening parenthesis)
+    json_start = html.find(b'{', match.end())
+    if json_start == -1:
+        return None
+    
+    # raw_decode stops at the end of the first complete object, so it
+    # handles brace matching and string escapes for us. Only the tail of
+    # the page from the object onwards needs decoding.
+    try:
+        text = html[json_start:].decode(encoding, errors='replace')
+        data, _ = JSON_DECODER.raw_decode(text)
+    except json.JSONDecodeError as e:
+        print(f"JSON parse error: {e}")
+        return None
+    return data
+
+
+async def block_unneeded_requests(route):
+    """Playwright route handler that drops assets and trackers"""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(part in request.url for part in BLOCKED_URL_PARTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def cache_path(round_url):
+    """Cache file for a round, keyed by the round id at the end of its URL"""
+    round_id = round_url.rstrip('/').rsplit('/', 1)[-1]
+    return CACHE_DIR / f'{round_id}.json'
+
+
+def load_cached_model(round_url):
+    """Return the cached scorecard model for a round, or None on a miss"""
+    path = cache_path(round_url)
+    if not path.exists():
+        return None
+    return orjson.loads(path.read_bytes())
+
+
+def save_cached_model(round_url, model):
+    """Write a round's scorecard model to the cache atomically"""
+    path = cache_path(round_url)
+    path.parent.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_bytes(orjson.dumps(model))
+    os.replace(tmp_path, path)
+
+
+def build_cookie_jar(cookies):
+    """Copy Playwright cookies into an aiohttp jar, keeping domain and path"""
+    jar = aiohttp.CookieJar()
+    for c in cookies:
+        if 'golfshot.com' not in c['domain']:
+            continue
+        
+        morsel = Morsel()
+        morsel.set(c['name'], c['value'], c['value'])
+        morsel['domain'] = c['domain']
+        morsel['path'] = c['path']
+        if c.get('secure'):
+            morsel['secure'] = True
+        if c.get('httpOnly'):
+            morsel['httponly'] = True
+        
+        # One update per cookie so same-named cookies on different
+        # domains or paths don't overwrite each other
+        jar.update_cookies({c['name']: morsel}, response_url=GOLFSHOT_URL)
+    return jar
+
+
+def with_holes(round_data):
+    """Swap a round's flat par/score lists for hole-by-hole dicts"""
+    round_data = dict(round_data)
+    par_values = round_data.pop('par_values')
+    score_values = round_data.pop('score_values')
+    round_data['holes'] = [
+        {'hole': i, 'par': par, 'score': score}
+        for i, (par, score) in enumerate(zip(par_values, score_values), 1)
+    ]
+    return round_data
+
+
 class GolfshotScraper:
-    def __init__(self, username, password):
+    def __init__(self, username=None, password=None, rounds_file='golfshot_scores.jsonl'):
+        # Missing credentials are asked for only if a login is needed
         self.username = username
         self.password = password
-        self.rounds_data = []
+        # Each run rewrites this file, one parsed round per line as they
+        # come in, rather than holding them all in memory until the end.
+        # Resuming after a crash comes from the model cache instead.
+        self.rounds_file = rounds_file
+        self.round_links = []
+        # Byte offset of each parsed round's line in the rounds file
+        self.round_offsets = {}
+        # Rounds downloaded this run (as opposed to loaded from the cache)
+        self.downloaded = 0
+    
+    def iter_rounds(self):
+        """Yield rounds from the rounds file in rounds-list order"""
+        if not os.path.exists(self.rounds_file):
+            return
+        
+        # Workers finish out of order, so sort line offsets by position in
+        # the rounds list and read each line back in that order
+        order = {url: i for i, url in enumerate(self.round_links)}
+        index = sorted(
+            (order.get(url, len(order)), offset)
+            for url, offset in self.round_offsets.items()
+        )
+        with open(self.rounds_file, 'rb') as f:
+            for _, offset in index:
+                f.seek(offset)
+                yield orjson.loads(f.readline())
         
     async def login(self, page):
         """Login to Golfshot"""
         print("Navigating to login page...")
-        await page.goto("https://play.golfshot.com/login")
+        await page.goto("https://play.golfshot.com/login", wait_until='domcontentloaded')
+        
+        # The saved session wasn't valid, so we need credentials after all
+        if self.username is None:
+            self.username = input("Enter your Golfshot email: ")
+        if self.password is None:
+            self.password = input("Enter your Golfshot password: ")
         
         # Wait for login form and fill it
         print("Entering credentials...")
@@ -30,15 +209,24 @@ class GolfshotScraper:
         # Click login button
         await page.click('button[type="submit"]')
         
-        # Wait for navigation to complete
-        await page.wait_for_load_state('networkidle')
+        # Wait until we're redirected away from the login page
+        await page.wait_for_url(lambda url: '/login' not in url)
         print("Login successful!")
+    
+    async def is_logged_in(self, page):
+        """Check whether the saved browser profile still has a valid session
+        
+        Leaves the page on the rounds list when the session is valid.
+        """
+        await page.goto(ROUNDS_URL, wait_until='domcontentloaded')
+        return '/login' not in page.url
         
     async def get_round_links(self, page):
         """Get all round URLs from the rounds page, handling pagination"""
         print("Fetching rounds list...")
-        await page.goto("https://play.golfshot.com/profiles/lOJZ5/rounds")
-        await page.wait_for_load_state('networkidle')
+        # is_logged_in may already have left us on the rounds page
+        if page.url != ROUNDS_URL:
+            await page.goto(ROUNDS_URL, wait_until='domcontentloaded')
         
         all_round_links = []
         page_num = 1
@@ -46,177 +234,91 @@ class GolfshotScraper:
         while True:
             print(f"\nScraping page {page_num}...")
             
-            # Wait a bit for dynamic content to load
-            await asyncio.sleep(2)
+            # Wait for the rounds table rather than for the network to go quiet
+            try:
+                await page.wait_for_selector(ROUND_ROW_SELECTOR, timeout=10000)
+            except PlaywrightTimeoutError:
+                print(f"  No rounds appeared on page {page_num}")
             
             # Extract round links from this page
             # The rounds are in table rows with data-href="/profiles/lOJZ5/rounds/{roundId}"
-            round_links = await page.evaluate('''() => {
-                const rows = Array.from(document.querySelectorAll('tr[data-href*="/rounds/"]'));
-                return rows
-                    .map(row => {
-                        const href = row.getAttribute('data-href');
-                        if (href && href.includes('/rounds/')) {
-                            // Convert relative URL to absolute
-                            return 'https://play.golfshot.com' + href;
-                        }
-                        return null;
-                    })
-                    .filter(href => href !== null);
-            }''')
+            round_links = await page.eval_on_selector_all(
+                ROUND_ROW_SELECTOR,
+                "rows => rows.map(row => 'https://play.golfshot.com' + row.getAttribute('data-href'))"
+            )
             
             print(f"  Found {len(round_links)} rounds on page {page_num}")
             all_round_links.extend(round_links)
             
-            # Check if there's a "Next" button and if it's enabled
-            # Need to check both the button exists and doesn't have 'disabled' class
-            next_button_info = await page.evaluate('''() => {
-                const nextButtons = document.querySelectorAll('a.btn-next');
-                for (const btn of nextButtons) {
-                    const classes = btn.className || '';
-                    const href = btn.getAttribute('href') || '';
-                    const isDisabled = classes.includes('disabled') || href === 'javascript:void(0)';
-                    
-                    if (!isDisabled && href && href !== 'javascript:void(0)') {
-                        return {
-                            exists: true,
-                            disabled: false,
-                            href: href
-                        };
-                    }
-                }
-                return { exists: false, disabled: true, href: null };
-            }''')
+            # Check if there's an enabled "Next" button (no 'disabled' class
+            # and a real href)
+            next_hrefs = await page.eval_on_selector_all(
+                'a.btn-next:not(.disabled)[href]:not([href=""]):not([href="javascript:void(0)"])',
+                "buttons => buttons.map(btn => btn.getAttribute('href'))"
+            )
+            next_href = next_hrefs[0] if next_hrefs else None
             
-            print(f"  Next button: exists={next_button_info['exists']}, disabled={next_button_info['disabled']}, href={next_button_info['href']}")
+            print(f"  Next button: href={next_href}")
             
-            if not next_button_info['exists'] or next_button_info['disabled']:
+            if not next_href:
                 print("  No more pages to scrape (next button disabled or missing)")
                 break
             
             # Navigate to the next page using the href
             try:
-                next_url = next_button_info['href']
+                next_url = next_href
                 if not next_url.startswith('http'):
                     next_url = 'https://play.golfshot.com' + next_url
                 
                 print(f"  Navigating to: {next_url}")
-                await page.goto(next_url)
-                await page.wait_for_load_state('networkidle')
+                await page.goto(next_url, wait_until='domcontentloaded')
                 page_num += 1
             except Exception as e:
                 print(f"  Error navigating to next page: {e}")
                 break
         
         # Remove duplicates while preserving order
-        unique_links = []
-        seen = set()
-        for link in all_round_links:
-            if link not in seen:
-                unique_links.append(link)
-                seen.add(link)
+        unique_links = list(dict.fromkeys(all_round_links))
         
         print(f"\n{'='*60}")
         print(f"Total unique rounds found: {len(unique_links)} across {page_num} page(s)")
         print(f"{'='*60}\n")
         return unique_links
     
-    def calculate_score_type(self, score, par):
-        """Determine if score is eagle, birdie, par, bogey, etc."""
-        diff = score - par
-        if diff <= -2:
-            return "Eagle or better"
-        elif diff == -1:
-            return "Birdie"
-        elif diff == 0:
-            return "Par"
-        elif diff == 1:
-            return "Bogey"
-        elif diff == 2:
-            return "Double Bogey"
-        else:
-            return "Triple Bogey or worse"
-    
-    async def scrape_round(self, page, round_url):
-        """Scrape data from a single round"""
+    async def fetch_model(self, session, round_url):
+        """Get a round's scorecard model from the cache or from Golfshot"""
+        model = load_cached_model(round_url)
+        if model is not None:
+            print(f"Using cached round: {round_url}")
+            return model
+        
         print(f"Scraping round: {round_url}")
-        await page.goto(round_url)
-        await page.wait_for_load_state('networkidle')
+        # The scorecard JSON is embedded in the server-rendered HTML,
+        # so a plain HTTP fetch is enough - no need to render the page
+        async with session.get(round_url) as response:
+            response.raise_for_status()
+            html = await response.read()
+            encoding = response.charset or 'utf-8'
         
+        # Be polite - wait a bit between requests
+        await asyncio.sleep(1)
+        
+        data = extract_scorecard_json(html, encoding)
+        if not data or not data.get('model'):
+            return None
+        
+        save_cached_model(round_url, data['model'])
+        self.downloaded += 1
+        return data['model']
+    
+    @staticmethod
+    def parse_round(model, round_url):
+        """Build a round's scores and stats from its scorecard model"""
         try:
-            # Extract the embedded JSON data from the React hydration script
-            data = await page.evaluate('''() => {
-                // Find the script tag containing the scorecard data
-                const scripts = document.querySelectorAll('script');
-                for (const script of scripts) {
-                    const text = script.textContent;
-                    if (text.includes('Golfshot.Applications.Scorecard')) {
-                        // Find the start of the JSON object
-                        const startIdx = text.indexOf('React.createElement(Golfshot.Applications.Scorecard, ');
-                        if (startIdx === -1) continue;
-                        
-                        // Find where the JSON starts (after the opening parenthesis)
-                        const jsonStart = text.indexOf('{', startIdx);
-                        if (jsonStart === -1) continue;
-                        
-                        // Find the matching closing brace for this JSON object
-                        let braceCount = 0;
-                        let jsonEnd = -1;
-                        let inString = false;
-                        let escapeNext = false;
-                        
-                        for (let i = jsonStart; i < text.length; i++) {
-                            const char = text[i];
-                            
-                            if (escapeNext) {
-                                escapeNext = false;
-                                continue;
-                            }
-                            
-                            if (char === '\\\\') {
-                                escapeNext = true;
-                                continue;
-                            }
-                            
-                            if (char === '"' && !escapeNext) {
-                                inString = !inString;
-                                continue;
-                            }
-                            
-                            if (!inString) {
-                                if (char === '{') {
-                                    braceCount++;
-                                } else if (char === '}') {
-                                    braceCount--;
-                                    if (braceCount === 0) {
-                                        jsonEnd = i + 1;
-                                        break;
-                                    }
-                                }
-                            }
-                        }
-                        
-                        if (jsonEnd === -1) continue;
-                        
-                        const jsonStr = text.substring(jsonStart, jsonEnd);
-                        
-                        try {
-                            return JSON.parse(jsonStr);
-                        } catch (e) {
-                            console.error('JSON parse error:', e.message);
-                            continue;
-                        }
-                    }
-                }
-                return null;
-            }''')
-            
-            if not data or not data.get('model'):
+            if not model:
                 print(f"Could not extract data from {round_url}")
                 return None
             
-            model = data['model']
-            
             # Initialize round data structure
             round_data = {
                 'url': round_url,
@@ -225,15 +327,9 @@ class GolfshotScraper:
                 'total_score': None,
                 'total_par': None,
                 'score_vs_par': None,
-                'holes': [],
-                'stats': {
-                    'eagles': 0,
-                    'birdies': 0,
-                    'pars': 0,
-                    'bogeys': 0,
-                    'double_bogeys': 0,
-                    'worse': 0
-                }
+                'par_values': [],
+                'score_values': [],
+                'stats': None
             }
             
             # Extract course and date info
@@ -246,50 +342,38 @@ class GolfshotScraper:
             par_values = par_data.get('values', [])
             
             # Extract score values - from the first player in the game
-            score_values = []
-            if 'game' in model and 'teams' in model['game']:
-                teams = model['game']['teams']
-                if teams and len(teams) > 0:
-                    players = teams[0].get('players', [])
-                    if players and len(players) > 0:
-                        scores = players[0].get('scores', [])
-                        score_values = [s['score'] for s in scores]
+            try:
+                scores = model['game']['teams'][0]['players'][0]['scores']
+            except (KeyError, IndexError, TypeError):
+                scores = []
+            score_values = list(map(get_score, scores))
             
-            # Build hole-by-hole data
-            for i, (par, score) in enumerate(zip(par_values, score_values), 1):
-                hole_data = {
-                    'hole': i,
-                    'par': par,
-                    'score': score
-                }
-                round_data['holes'].append(hole_data)
-                
-                # Calculate score type
-                score_type = self.calculate_score_type(score, par)
-                
-                if score_type == "Eagle or better":
-                    round_data['stats']['eagles'] += 1
-                elif score_type == "Birdie":
-                    round_data['stats']['birdies'] += 1
-                elif score_type == "Par":
-                    round_data['stats']['pars'] += 1
-                elif score_type == "Bogey":
-                    round_data['stats']['bogeys'] += 1
-                elif score_type == "Double Bogey":
-                    round_data['stats']['double_bogeys'] += 1
-                else:
-                    round_data['stats']['worse'] += 1
+            # Only holes with both a par and a score count
+            num_holes = min(len(par_values), len(score_values))
+            par_values = par_values[:num_holes]
+            score_values = score_values[:num_holes]
             
-            # Calculate totals
-            if round_data['holes']:
-                round_data['total_score'] = sum(h['score'] for h in round_data['holes'])
-                round_data['total_par'] = sum(h['par'] for h in round_data['holes'])
+            # Keep per-hole pars and scores as two flat lists; the
+            # hole-by-hole dicts are only built for the JSON export
+            round_data['par_values'] = par_values
+            round_data['score_values'] = score_values
+            
+            # Totals and score-type counts in a single vectorized pass
+            par_arr = np.asarray(par_values, dtype=np.int16)
+            score_arr = np.asarray(score_values, dtype=np.int16)
+            buckets = np.clip(score_arr - par_arr + 2, 0, len(STAT_KEYS) - 1)
+            counts = np.bincount(buckets, minlength=len(STAT_KEYS))
+            round_data['stats'] = dict(zip(STAT_KEYS, counts.tolist()))
+            
+            if num_holes:
+                round_data['total_score'] = int(score_arr.sum())
+                round_data['total_par'] = int(par_arr.sum())
                 round_data['score_vs_par'] = round_data['total_score'] - round_data['total_par']
             
             return round_data
             
         except Exception as e:
-            print(f"Error scraping round {round_url}: {e}")
+            print(f"Error parsing round {round_url}: {e}")
             import traceback
             traceback.print_exc()
             return None
@@ -297,34 +381,79 @@ class GolfshotScraper:
     async def scrape_all_rounds(self):
         """Main scraping function"""
         async with async_playwright() as p:
-            # Launch browser (set headless=False to see what's happening)
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
+            # Launch browser with a persistent profile so cookies survive
+            # between runs
+            context = await p.chromium.launch_persistent_context(
+                PROFILE_DIR, headless=HEADLESS, args=BROWSER_ARGS
+            )
+            await context.route('**/*', block_unneeded_requests)
+            page = context.pages[0] if context.pages else await context.new_page()
             
             try:
-                # Login
-                await self.login(page)
+                # Login, unless the saved session is still valid
+                if await self.is_logged_in(page):
+                    print("Already logged in, skipping login")
+                else:
+                    await self.login(page)
+                
+                # Get all round links. Every round is re-parsed each run, so
+                # rounds already in the cache cost no network time and pick
+                # up any changes to the stats code
+                self.round_links = round_links = await self.get_round_links(page)
+                self.round_offsets = {}
+                self.downloaded = 0
                 
-                # Get all round links
-                round_links = await self.get_round_links(page)
+                # Reuse the logged-in session's cookies for direct HTTP fetches
+                jar = build_cookie_jar(await context.cookies())
+                user_agent = await page.evaluate('navigator.userAgent')
                 
-                # Scrape each round
+                # Scrape rounds concurrently with a pool of workers
+                total = len(round_links)
+                queue = asyncio.Queue()
                 for i, round_url in enumerate(round_links, 1):
-                    print(f"Processing round {i}/{len(round_links)}")
-                    round_data = await self.scrape_round(page, round_url)
-                    if round_data:
-                        self.rounds_data.append(round_data)
+                    queue.put_nowait((i, round_url))
+                
+                sem = asyncio.BoundedSemaphore(CONCURRENCY)
+                
+                async with aiohttp.ClientSession(
+                    cookie_jar=jar,
+                    headers={'User-Agent': user_agent},
+                    connector=aiohttp.TCPConnector(
+                        limit=64,
+                        limit_per_host=16,
+                        ttl_dns_cache=300,
+                        enable_cleanup_closed=True,
+                    ),
+                ) as session, open(self.rounds_file, 'wb') as rounds_fh:
+                    async def fetch(round_url):
+                        async with sem:
+                            try:
+                                return await self.fetch_model(session, round_url)
+                            except Exception as e:
+                                print(f"Error fetching round {round_url}: {e}")
+                                return None
+                    
+                    async def worker():
+                        while not queue.empty():
+                            i, round_url = queue.get_nowait()
+                            model = await fetch(round_url)
+                            
+                            print(f"Processing round {i}/{total}")
+                            round_data = self.parse_round(model, round_url)
+                            if round_data:
+                                # Flush each round so a crash loses nothing
+                                self.round_offsets[round_url] = rounds_fh.tell()
+                                rounds_fh.write(orjson.dumps(round_data) + b'\n')
+                                rounds_fh.flush()
                     
-                    # Be polite - wait a bit between requests
-                    await asyncio.sleep(1)
+                    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
                 
             finally:
-                await browser.close()
+                await context.close()
     
     def export_to_csv(self, filename='golfshot_scores.csv'):
         """Export scraped data to CSV"""
-        if not self.rounds_data:
+        if not self.round_offsets:
             print("No data to export")
             return
         
@@ -336,37 +465,51 @@ class GolfshotScraper:
                 'Bogeys', 'Double Bogeys', 'Triple+ Bogeys'
             ])
             
-            for round_data in self.rounds_data:
-                writer.writerow([
+            # Stream rows straight from the rounds file in one writerows call
+            writer.writerows(
+                [
                     round_data['date'],
                     round_data['course'],
                     round_data['total_score'],
                     round_data['total_par'],
                     round_data['score_vs_par'],
-                    round_data['stats']['eagles'],
-                    round_data['stats']['birdies'],
-                    round_data['stats']['pars'],
-                    round_data['stats']['bogeys'],
-                    round_data['stats']['double_bogeys'],
-                    round_data['stats']['worse']
-                ])
+                    *(round_data['stats'][key] for key in STAT_KEYS)
+                ]
+                for round_data in self.iter_rounds()
+            )
         
         print(f"Data exported to {filename}")
     
-    def export_to_json(self, filename='golfshot_scores.json'):
-        """Export scraped data to JSON"""
-        with open(filename, 'w') as f:
-            json.dump(self.rounds_data, f, indent=2)
+    def export_to_json(self, filename='golfshot_scores.json', pretty=False, compress=False):
+        """Export scraped data to JSON
+        
+        Output is compact unless pretty=True; compress=True gzips it to
+        filename + '.gz' instead.
+        """
+        if compress:
+            filename += '.gz'
+            f = gzip.open(filename, 'wb', compresslevel=3)
+        else:
+            f = open(filename, 'wb')
+        
+        with f:
+            rounds = map(with_holes, self.iter_rounds())
+            if pretty:
+                f.write(orjson.dumps(list(rounds), option=orjson.OPT_INDENT_2))
+            else:
+                # Stream the array one round at a time
+                f.write(b'[')
+                for i, round_data in enumerate(rounds):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(round_data))
+                f.write(b']')
         print(f"Detailed data exported to {filename}")
 
 
 async def main():
-    # Get credentials
-    username = input("Enter your Golfshot email: ")
-    password = input("Enter your Golfshot password: ")
-    
-    # Create scraper instance
-    scraper = GolfshotScraper(username, password)
+    # Create scraper instance; it asks for credentials if it has to log in
+    scraper = GolfshotScraper()
     
     # Run scraping
     print("\nStarting scrape...")
@@ -379,9 +522,13 @@ async def main():
     # Print summary
     print(f"\n{'='*50}")
     print(f"Scraping complete!")
-    print(f"Total rounds scraped: {len(scraper.rounds_data)}")
+    print(f"Rounds downloaded this run: {scraper.downloaded}")
+    print(f"Total rounds exported: {len(scraper.round_offsets)}")
     print(f"{'='*50}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())